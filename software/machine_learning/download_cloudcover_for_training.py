@@ -1,51 +1,53 @@
 """
 ***************************************************************************
  * File name: download_cloudcover_training.py
- * Description: Script to download hourly cloud cover data from the 
- *              Open-Meteo historical API and save it as a CSV file.
+ * Description: Script to download hourly cloud cover data from the
+ *              Open-Meteo historical API and save it as CSV files.
  * Author: Maria Eduarda Vianna
  * Creation date: 10-05-2025
  * Last modified: 11-27-2025
  * Contact: mewmvianna@gmail.com
  * ***************************************************************************
  * Description:
- * This script fetches one full year of hourly cloud-cover data from the
- * Open-Meteo Archive API.  It was used to
- * download the datasets for the years 2022, 2023, and 2024 by adjusting
- * the start_date and end_date parameters.
+ * This script fetches three full years (2022-2024) of hourly cloud-cover
+ * data from the Open-Meteo Archive API in a single request, instead of one
+ * HTTP round-trip per year. The raw API response is cached on disk, so
+ * re-running the script (e.g. to regenerate the CSVs) does not hit the API
+ * again.
  *
  * Workflow:
- * 1. Define the API endpoint with:
- *        - latitude & longitude  
- *        - start_date & end_date  
- *        - hourly variables (cloudcover)  
- *        - timezone
- * 2. Send an HTTP GET request to the API.
- * 3. Parse the returned JSON data.
- * 4. Extract hourly timestamps and cloud-cover values into a DataFrame.
- * 5. Save the output to "cloudcover_2022.csv".
- * 6. Print a confirmation message.
+ * 1. If a cached (gzip-compressed) API response exists next to this
+ *    script, load it.
+ * 2. Otherwise, send one HTTP GET request covering 2022-01-01 to 2024-12-31
+ *    and save the raw JSON to the cache file.
+ * 3. Extract hourly timestamps and cloud-cover values into a DataFrame.
+ * 4. Split the data by year and save one CSV per year
+ *    (cloudcover_2022.csv, cloudcover_2023.csv, cloudcover_2024.csv),
+ *    as expected by merge_cloudcover.py.
+ * 5. Print a confirmation message per file.
  *
  * Inputs:
- *   - None (data is obtained directly from the API).
+ *   - None (data is obtained from the API, or from the local cache).
  *
  * Outputs:
- *   - "cloudcover_2022.csv": CSV file saved in the same folder as this script,
- *       containing:
+ *   - "cloudcover_raw_2022_2024.json.gz": cached (gzip) raw API response.
+ *   - "cloudcover_2022.csv", "cloudcover_2023.csv", "cloudcover_2024.csv":
+ *       CSV files saved in the same folder as this script, containing:
  *           - datetime (ISO timestamps)
- *           - cloudcover (0–100%)
- *
- *   - The same script was also used to generate "cloudcover_2023.csv" and
- *     "cloudcover_2024.csv" by adjusting only the start_date and end_date.
+ *           - cloudcover (0-100%)
  *
  * Requirements:
  *   - Python 3.8+
  *   - Libraries:
-          - os
+          - gzip
+ *        - json
+ *        - os
  *        - requests
  *        - pandas
  ***************************************************************************
 """
+import gzip
+import json
 import os
 import requests
 import pandas as pd
@@ -53,17 +55,31 @@ import pandas as pd
 # Prints the current working directory (where Python is running from)
 print("Working directory:", os.getcwd())
 
-# URL for the API
+# Folder of the script: cache and CSVs live here
+script_dir = os.path.dirname(os.path.abspath(__file__))
+cache_path = os.path.join(script_dir, "cloudcover_raw_2022_2024.json.gz")
+
+# URL for the API: one request covering all three years
 url = (
     "https://archive-api.open-meteo.com/v1/archive?"
     "latitude=-28.951476920243184&longitude=-49.4671919955338"
-    "&start_date=2022-01-01&end_date=2022-12-31"
+    "&start_date=2022-01-01&end_date=2024-12-31"
     "&hourly=cloudcover&timezone=UTC"
 )
 
-# Send request
-response = requests.get(url)
-data = response.json()
+# Use the cached response when available, otherwise fetch and cache it
+if os.path.exists(cache_path):
+    print("Using cached API response:", cache_path)
+    with gzip.open(cache_path, "rt") as f:
+        data = json.load(f)
+else:
+    print("Fetching 2022-2024 cloud cover from the API...")
+    response = requests.get(url)
+    data = response.json()
+    # gzip shrinks the 3-year JSON payload several-fold on disk
+    with gzip.open(cache_path, "wt") as f:
+        json.dump(data, f)
+    print("Raw response cached at:", cache_path)
 
 # Extract cloud cover data
 df = pd.DataFrame({
@@ -71,10 +87,9 @@ df = pd.DataFrame({
     "cloudcover": data["hourly"]["cloudcover"]
 })
 
-# Save to CSV in the same folder as the script
-script_dir = os.path.dirname(os.path.abspath(__file__))
-output_path = os.path.join(script_dir, "cloudcover_2022.csv")
-
-# Save to CSV
-df.to_csv(output_path, index=False)
-print("cloudcover_2022.csv saved!")
\ No newline at end of file
+# Split by year and save one CSV per year (as merge_cloudcover.py expects)
+years = df["datetime"].str[:4]
+for year in ("2022", "2023", "2024"):
+    output_path = os.path.join(script_dir, f"cloudcover_{year}.csv")
+    df[years == year].to_csv(output_path, index=False)
+    print(f"cloudcover_{year}.csv saved!")
@@ -12,20 +12,21 @@
  * Contact: mewmvianna@gmail.com
  * *************************************************************************
  * Description:
- * This script reads three CSV files containing hourly cloud-cover data 
- * for the years 2022, 2023, and 2024. It concatenates them into a single 
- * pandas DataFrame, converts the timestamps to datetime objects, sorts 
- * them in chronological order, and exports the final combined dataset as 
- * "cloudcover_3_years.csv".
+ * This script reads three CSV files containing hourly cloud-cover data
+ * for the years 2022, 2023, and 2024. It concatenates them into a single
+ * PyArrow table, with the timestamps parsed during the read itself, sorts
+ * them in chronological order, and exports the final combined dataset as
+ * "cloudcover_3_years.parquet".
  *
  * Workflow:
  * 1. Define a list containing the input CSV filenames.
- * 2. Load each CSV into an individual DataFrame.
- * 3. Concatenate all DataFrames into one structure.
- * 4. Convert the 'datetime' column into a proper datetime type.
- * 5. Sort the full dataset chronologically.
- * 6. Save the final merged dataset to "cloudcover_3years.csv" in the same 
- *    directory where this script is located.
+ * 2. Load each CSV into a PyArrow table (multi-threaded parser), with the
+ *    'datetime' column converted to a timestamp during the read itself.
+ * 3. Concatenate all tables into one (zero-copy).
+ * 4. Sort the full dataset chronologically.
+ * 5. Convert to pandas for saving and inspection.
+ * 6. Save the final merged dataset to "cloudcover_3_years.parquet" in the
+ *    same directory where this script is located.
  * 7. Display:
  *        - Total number of combined rows
  *        - First few records
@@ -38,41 +39,41 @@
  *        - cloudcover_2024.csv
  *
  * Outputs:
- *   - "cloudcover_3_years.csv": consolidated 3-year cloud-cover dataset.
+ *   - "cloudcover_3_years.parquet": consolidated 3-year cloud-cover dataset.
  *
  * Requirements:
  *   - Python 3.8+
  *   - pandas
+ *   - pyarrow
  ***************************************************************************
 """
 
 import os
-import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
 # List with the names of the files
 files = ["cloudcover_2022.csv", "cloudcover_2023.csv", "cloudcover_2024.csv"]
 
-# List to store the data from each file
-dataframes_list = []
+# Parse 'datetime' as a timestamp during the read itself (no pd.to_datetime pass)
+convert_options = pacsv.ConvertOptions(column_types={"datetime": pa.timestamp("s")})
 
 print("Reading and merging cloud cover files...")
-for file in files:
-    df = pd.read_csv(file)
-    dataframes_list.append(df)
+tables = [pacsv.read_csv(file, convert_options=convert_options) for file in files]
 
-# Merge all dataframes into one
-combined_cloudcover_df = pd.concat(dataframes_list, ignore_index=True)
+# Merge all tables into one (zero-copy) and sort chronologically
+combined_table = pa.concat_tables(tables).sort_by("datetime")
 
-# Ensure datetime is properly sorted
-combined_cloudcover_df["datetime"] = pd.to_datetime(combined_cloudcover_df["datetime"])
-combined_cloudcover_df = combined_cloudcover_df.sort_values(by="datetime")
+# Convert to pandas for saving and inspection
+combined_cloudcover_df = combined_table.to_pandas(self_destruct=True)
 
 # Save in the same folder as the script
-output_filename = "cloudcover_3_years.csv"
+output_filename = "cloudcover_3_years.parquet"
 script_dir = os.path.dirname(os.path.abspath(__file__))   # folder of the script
 output_path = os.path.join(script_dir, output_filename)   # final path
 
-combined_cloudcover_df.to_csv(output_path, index=False)
+# Parquet keeps the timestamp dtype with the data for the next stage
+combined_cloudcover_df.to_parquet(output_path, index=False, compression="zstd")
 
 print(f"\nFile '{output_filename}' created successfully!")
 print(f"Saved at: {output_path}")
@@ -11,9 +11,9 @@
  * Contact: mewmvianna@gmail.com
  * *************************************************************************
  * Description:
- * This script reads two CSV files containing 3-year datasets:
- *     - inmet_3_years.csv       -> cleaned meteorological observations from INMET  
- *     - cloudcover_3_years.csv  -> multi-year cloud-cover data from Open-Meteo  
+ * This script reads two Parquet files containing 3-year datasets:
+ *     - inmet_3_years.parquet       -> cleaned meteorological observations from INMET
+ *     - cloudcover_3_years.parquet  -> multi-year cloud-cover data from Open-Meteo
  *
  * Both datasets contain an aligned timestamp column (`datetime`), enabling a
  * precise temporal merge to create a single hourly dataset. Only timestamps
@@ -24,19 +24,20 @@
  * 2. Load the 3-year cloud-cover dataset.
  * 3. Merge both DataFrames on the `datetime` column using an inner join.
  * 4. Sort chronologically for consistency.
- * 5. Save the final combined dataset as cloudcover_inmet_3_years_merged.csv.
+ * 5. Save the final combined dataset as cloudcover_inmet_3_years_merged.parquet.
  * 6. Print the first few rows for verification.
  *
  * Inputs:
- *   - inmet_3_years.csv
- *   - cloudcover_3_years.csv
+ *   - inmet_3_years.parquet
+ *   - cloudcover_3_years.parquet
  *
  * Output:
- *   - cloudcover_inmet_3_years_merged.csv
+ *   - cloudcover_inmet_3_years_merged.parquet
  *
  * Requirements:
  *   - Python 3.8+
  *   - pandas
+ *   - pyarrow
 ***************************************************************************
 """
 
@@ -51,18 +52,25 @@ from pathlib import Path
 BASE_DIR = Path(__file__).parent
 
 print("--- Reading files ---")
-df_inmet = pd.read_csv(BASE_DIR / "inmet_3_years.csv", parse_dates=["datetime"])
-df_cloud = pd.read_csv(BASE_DIR / "cloudcover_3_years.csv", parse_dates=["datetime"])
+df_inmet = pd.read_parquet(BASE_DIR / "inmet_3_years.parquet")
+df_cloud = pd.read_parquet(BASE_DIR / "cloudcover_3_years.parquet")
 
-# Merge by datetime (inner = only where both datasets have data)
-df = pd.merge(df_inmet, df_cloud, on="datetime", how="inner")
+# Merge by datetime (inner = only where both datasets have data).
+# Both inputs leave their producer scripts sorted, so an index join walks
+# the ordered keys instead of building a hash table over every timestamp
+df = (
+    df_inmet.set_index("datetime")
+    .join(df_cloud.set_index("datetime"), how="inner")
+    .reset_index()
+)
 
-# Sort just to ensure correct ordering
-df = df.sort_values("datetime").reset_index(drop=True)
+# Joining two sorted inputs yields sorted output, so no re-sort is
+# needed; the assert documents (and guards) that invariant
+assert df["datetime"].is_monotonic_increasing
 
 # Save final merged file in the same folder as this script
-output_filename = BASE_DIR / "cloudcover_inmet_3_years_merged.csv"
-df.to_csv(output_filename, index=False)
+output_filename = BASE_DIR / "cloudcover_inmet_3_years_merged.parquet"
+df.to_parquet(output_filename, index=False, compression="zstd")
 
 print(f"--- File saved: {output_filename.name} ---")
 print(df.head())
@@ -19,14 +19,14 @@
  * Workflow:
  * 1. Define the input INMET files for 2022, 2023, and 2024.
  * 2. Read each file using:
- *        - semicolon separator  
- *        - comma as decimal separator  
- *        - all values as strings (to avoid parsing issues)
- * 3. Remove spurious header lines that appear inside the file.
- * 4. Build a proper `datetime` column by combining “Data” + “Hora UTC”.
- * 5. Concatenate the yearly DataFrames.
+ *        - semicolon separator
+ *        - comma as decimal separator (numeric columns parsed natively)
+ *        - strings only for the "Data" and "Hora UTC" columns
+ * 3. Skip spurious header lines inside the file during the read itself.
+ * 4. Concatenate the yearly DataFrames.
+ * 5. Build a proper `datetime` column by combining “Data” + “Hora UTC”.
  * 6. Sort the full dataset chronologically.
- * 7. Select the relevant meteorological variables 
+ * 7. Select the relevant meteorological variables
  *    (precipitation, pressure, temperature, humidity, wind).
  * 8. Standardize column names.
  * 9. Export the cleaned dataset for downstream processing.
@@ -37,15 +37,17 @@
  *   - INMET_S_SC_A867_ARARANGUA_01-01-2024_A_31-12-2024.csv
  *
  * Output:
- *   - inmet_3_years.csv (cleaned and standardized dataset)
+ *   - inmet_3_years.parquet (cleaned and standardized dataset)
  *
  * Requirements:
  *   - Python 3.8+
  *   - pandas
+ *   - pyarrow
 ***************************************************************************
 """
 
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # ======================================================================
@@ -64,78 +66,100 @@ inmet_files = [
     BASE_DIR / "INMET_S_SC_A867_ARARANGUA_01-01-2024_A_31-12-2024.csv"
 ]
 
-dfs = []
+# Columns kept from the raw files and their standardized names
+keep = {
+    "PRECIPITACAO TOTAL, HORARIO (mm)": "precip_mm",
+    "PRESSAO ATMOSFERICA AO NIVEL DA ESTACAO, HORARIA (mB)": "pressure_mB",
+    "TEMPERATURA DO AR - BULBO SECO, HORARIA (graus C)": "temp_C",
+    "UMIDADE RELATIVA DO AR, HORARIA (%)": "rh_pct",
+    "VENTO, DIRECAO HORARIA (gr) ( (gr))": "wind_dir_deg",
+    "VENTO, VELOCIDADE HORARIA (m/s)": "wind_speed_m_s"
+}
 
-# ======================================================================
-# PROCESS EACH YEAR
-# ======================================================================
 
-for file in inmet_files:
-    # Read fully as text to avoid parsing mistakes
-    df = pd.read_csv(file, sep=";", decimal=",", dtype=str)
+def repeated_header_rows(path):
+    """Line numbers of header lines repeated inside the file, so the
+    reader can skip them instead of materializing and filtering them."""
+    with open(path) as f:
+        return [i for i, line in enumerate(f) if i > 0 and line.startswith("Data;")]
+
+
+def read_inmet_file(file):
+    """Read one yearly INMET export."""
+    # Let the C tokenizer parse comma decimals natively; only the date and
+    # time columns need to stay as text for the datetime reconstruction.
+    # Repeated header lines are skipped during the read itself, and usecols
+    # stops the parser from ever tokenizing the ~dozen discarded columns.
+    return pd.read_csv(
+        file,
+        sep=";",
+        decimal=",",
+        dtype={"Data": str, "Hora UTC": str},
+        na_values=["", "-9999"],
+        skiprows=repeated_header_rows(file),
+        on_bad_lines="skip",
+        usecols=["Data", "Hora UTC"] + list(keep.keys()),
+    )
 
-    # Remove repeated header lines inside the file
-    df = df[df["Data"] != "Data"]
 
-    # Create proper datetime
-    df["datetime"] = pd.to_datetime(
-        df["Data"] + " " + df["Hora UTC"].str.replace(" UTC", ""),
-        format="%Y/%m/%d %H%M"
-    )
+# ======================================================================
+# PROCESS EACH YEAR
+# ======================================================================
 
-    dfs.append(df)
+# The three yearly files are independent, so their reads (I/O plus the
+# GIL-releasing C parse) overlap in a small thread pool
+with ThreadPoolExecutor(max_workers=len(inmet_files)) as pool:
+    dfs = list(pool.map(read_inmet_file, inmet_files))
 
 # ======================================================================
 # CONCATENATE + SORT
 # ======================================================================
 
 df_inmet = pd.concat(dfs, ignore_index=True)
-df_inmet = df_inmet.sort_values("datetime").reset_index(drop=True)
+
+# Create proper datetime without building an intermediate "date time"
+# string column: parse the date part with the repeat-value cache (each day
+# appears 24 times) and add the hour as a timedelta. Readings are hourly,
+# so the first two digits of "HHMM UTC" carry all the time information.
+df_inmet.insert(
+    0,
+    "datetime",
+    pd.to_datetime(df_inmet["Data"], format="%Y/%m/%d", cache=True)
+    + pd.to_timedelta(df_inmet["Hora UTC"].str[:2].astype("int16"), unit="h"),
+)
+
+# The yearly files are chronologically disjoint and read in order, so the
+# concatenated frame is normally already sorted — one monotonicity check
+# replaces the sort. The mergesort fallback (near-linear on almost-sorted
+# data) only runs if a raw file ever arrives out of order.
+if not df_inmet["datetime"].is_monotonic_increasing:
+    df_inmet = df_inmet.sort_values("datetime", kind="mergesort", ignore_index=True)
 
 # ======================================================================
-# SELECT AND RENAME COLUMNS
+# RENAME COLUMNS
 # ======================================================================
 
-keep = {
-    "PRECIPITACAO TOTAL, HORARIO (mm)": "precip_mm",
-    "PRESSAO ATMOSFERICA AO NIVEL DA ESTACAO, HORARIA (mB)": "pressure_mB",
-    "TEMPERATURA DO AR - BULBO SECO, HORARIA (graus C)": "temp_C",
-    "UMIDADE RELATIVA DO AR, HORARIA (%)": "rh_pct",
-    "VENTO, DIRECAO HORARIA (gr) ( (gr))": "wind_dir_deg",
-    "VENTO, VELOCIDADE HORARIA (m/s)": "wind_speed_m_s"
-}
-
-df_inmet = df_inmet[["datetime"] + list(keep.keys())]
-df_inmet = df_inmet.rename(columns=keep)
+# usecols already trimmed the frame at read time, so only the raw date and
+# time text columns need dropping before the rename
+df_inmet = df_inmet.drop(columns=["Data", "Hora UTC"]).rename(columns=keep)
 
 # ======================================================================
-# CONVERT STRINGS TO FLOATS
+# MISSING READINGS
 # ======================================================================
 
-for col in ["pressure_mB", "temp_C", "wind_speed_m_s"]:
-    df_inmet[col] = (
-        df_inmet[col]
-        .astype(str)
-        .str.replace(",", ".", regex=False)
-        .replace("", "0")
-        .astype(float)
-    )
-
-df_inmet["precip_mm"] = (
-    df_inmet["precip_mm"]
-    .astype(str)
-    .str.strip()
-    .replace(r'^,', '0,', regex=True)
-    .str.replace(",", ".", regex=False)
-    .astype(float)
-)
+# Empty cells and -9999 sentinels became NaN at read time (na_values) and
+# stay NaN: the training stage relies on XGBoost's native missing-value
+# handling, and zero-filling here would turn sensor outages into
+# plausible-looking readings (e.g. a 0.0 mB pressure)
 
 # ======================================================================
 # SAVE OUTPUT IN THE SAME FOLDER
 # ======================================================================
 
-output_file = BASE_DIR / "inmet_3_years.csv"
-df_inmet.to_csv(output_file, index=False)
+# Parquet keeps the dtypes (datetime included) with the data, so the next
+# pipeline stage loads it without re-tokenizing text
+output_file = BASE_DIR / "inmet_3_years.parquet"
+df_inmet.to_parquet(output_file, index=False, compression="zstd")
 
 print(f"--- File saved: {output_file.name} ---")
 print(df_inmet.head())
@@ -95,6 +95,32 @@ const __filename = fileURLToPath(import.meta.url);
  */
 const __dirname = path.dirname(__filename);
 
+/**
+ * Long-lived Python prediction service (XGBoost model).
+ *
+ * Started once here so the Python interpreter, the xgboost import and the
+ * model load are paid a single time; each forecast is then a local HTTP
+ * call instead of a full interpreter spawn.
+ */
+const predictionServicePath = path.join(
+  __dirname,
+  "src",
+  "python",
+  "server.py"
+);
+const predictionService = spawn("python", [predictionServicePath], {
+  stdio: ["ignore", "inherit", "inherit"],
+});
+predictionService.on("exit", (code) =>
+  console.error(`Prediction service exited with code: ${code}`)
+);
+
+/**
+ * URL of the local prediction service.
+ * @constant {string}
+ */
+const PREDICT_URL = "http://127.0.0.1:5001/predict";
+
 /**
  * Latest meteorological data received from the ESP.
  * @type {Object}
@@ -198,17 +224,17 @@ async function generateFeatures() {
   ];
 }
 /**
- * Generates a rain forecast based on the meteorological *features*, executing an external
- * Python script responsible for the prediction model.
+ * Generates a rain forecast based on the meteorological *features*, querying the
+ * long-lived Python prediction service responsible for the model.
  *
  * The function validates the provided *features*, normalizes the data, and, if the current
  * precipitation is greater than zero and different from the last recorded value, it sends the
- * values to the Python script (`server.py`) through a child process.
+ * values to the prediction service (`server.py`) via a local HTTP POST.
  *
- * The result returned by Python is read via *stdout*, parsed as JSON, and resolved as a
- * JavaScript object. The resulting forecast is stored in the global variable `lastPrediction`.
+ * The JSON returned by the service is resolved as a JavaScript object. The resulting
+ * forecast is stored in the global variable `lastPrediction`.
  *
- * In case of validation failure or an error during execution/parsing of the Python script,
+ * In case of validation failure or an error while querying the prediction service,
  * the Promise is rejected with a descriptive message.
  *
  * @async
@@ -232,63 +258,46 @@ async function generateFeatures() {
  * }
  */
 async function generatePrediction(features = null) {
-  return new Promise((resolve, reject) => {
-    try {
-      if (!features) {
-        return reject("Sem dados atuais disponíveis");
-      } else if (!Array.isArray(features) || features.length < 6) {
-        return reject("Features inválidas para previsão");
-      } else {
-        const input = [
-          features[0] * 0.01, // pressure_mbar
-          features[1], // temperature
-          features[2], // humidity
-          0, // windSpeed
-          0, // windDirection
-          features[4], // cloudCover
-        ];
-
-        if (features[5] > 0 && features[5] != lastPrecipitation) {
-          console.log("Precipitação detectada!");
-          lastPrediction = { prediction: [[0, 1]] };
-          lastPrecipitation = features[5];
-          return resolve(lastPrediction);
-        }
-        features = input;
-      }
-
-      console.log("Generating forecasts with features:", features);
-
-      const pyPath = path.join(__dirname, "src", "python", "server.py");
-      const py = spawn("python", [pyPath]);
-
-      let resultData = "";
-      py.stdout.on("data", (data) => (resultData += data.toString()));
-      py.stderr.on("data", (data) =>
-        console.error("Python stderr:", data.toString())
-      );
-
-      py.on("close", (code) => {
-        console.log(`Python process completed with code: ${code}`);
-        try {
-          const parsed = JSON.parse(resultData);
-          lastPrediction = parsed;
-          console.log("New prediction generated:", parsed);
-          resolve(parsed);
-        } catch (err) {
-          console.error("Error interpreting Python output:", err, resultData);
-          reject("Error interpreting model response.");
-        }
-      });
-
-      py.stdin.write(JSON.stringify({ features }));
-      py.stdin.end();
-      lastPrecipitation = features[5];
-    } catch (error) {
-      console.error("Error generating prediction:", error);
-      reject(error);
-    }
-  });
+  if (!features) {
+    throw "Sem dados atuais disponíveis";
+  } else if (!Array.isArray(features) || features.length < 6) {
+    throw "Features inválidas para previsão";
+  }
+
+  const input = [
+    features[0] * 0.01, // pressure_mbar
+    features[1], // temperature
+    features[2], // humidity
+    0, // windSpeed
+    0, // windDirection
+    features[4], // cloudCover
+  ];
+
+  if (features[5] > 0 && features[5] != lastPrecipitation) {
+    console.log("Precipitação detectada!");
+    lastPrediction = { prediction: [[0, 1]] };
+    lastPrecipitation = features[5];
+    return lastPrediction;
+  }
+  features = input;
+
+  console.log("Generating forecasts with features:", features);
+
+  try {
+    const response = await fetch(PREDICT_URL, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ features }),
+    });
+    const parsed = await response.json();
+    lastPrediction = parsed;
+    lastPrecipitation = features[5];
+    console.log("New prediction generated:", parsed);
+    return parsed;
+  } catch (error) {
+    console.error("Error querying prediction service:", error);
+    throw "Error interpreting model response.";
+  }
 }
 
 /**
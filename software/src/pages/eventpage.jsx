@@ -34,10 +34,9 @@
  * - Loading and error messages for each request;
  * - A safety notice about astronomical observation.
  *
- * The component performs three asynchronous backend calls:
- * 1. `/get_first_image` — returns the event's main image;
- * 2. `/get_icon` — returns alternative text or caption of the associated icon;
- * 3. `/get_credits` — returns the image credit text.
+ * The component performs one asynchronous backend call:
+ * 1. `/get_metadata` — returns the event's main image, the alternative
+ *    text of the associated icon, and the image credit text together.
  *
  * ### Hooks used:
  * - `useState`: Stores local states such as the image URL, credits, and loading/error states.
@@ -46,8 +45,8 @@
  * @remarks
  * - Parameters such as *title*, *description*, and *link* are received via URL.
  * - The description text may contain HTML entities, which are processed via regex.
- * - The image and credits are loaded independently, each with
- *   its own loading and error state.
+ * - The image and credits keep their own loading and error states,
+ *   both filled from the single metadata request.
  * - If the link is not provided, the requests are ignored.
  */
 
@@ -140,9 +139,10 @@ function EventPage() {
   const [errorCredit, setErrorCredit] = useState(null);
 
   /**
-   * Effect responsible for fetching the event’s first image.
+   * Effect responsible for fetching the event metadata (image, icon text
+   * and credits) in a single request.
    * Runs whenever `link` changes.
-   * Sends a POST request to `/get_first_image`.
+   * Sends a POST request to `/get_metadata`.
    * @async
    * @effect
    * @returns {Promise<void>}
@@ -151,57 +151,13 @@ function EventPage() {
   useEffect(() => {
     if (link) {
       setLoadingImage(true);
+      setLoadingCredit(true);
       setErrorImage(null);
+      setErrorCredit(null);
 
-      const fetchImage = async () => {
-        try {
-          const response = await fetch(
-            "http://127.0.0.1:5000/get_first_image",
-            {
-              method: "POST",
-              headers: {
-                "Content-Type": "application/json",
-              },
-              body: JSON.stringify({ link: link }),
-            }
-          );
-
-          if (!response.ok) {
-            throw new Error(`Erro na API: ${response.status}`);
-          }
-
-          const data = await response.json();
-          setImageUrl(data.image_url);
-        } catch (error) {
-          console.error("Erro ao buscar imagem:", error);
-          setErrorImage(error.message);
-        } finally {
-          setLoadingImage(false);
-        }
-      };
-
-      fetchImage();
-    } else {
-      setLoadingImage(false);
-    }
-  }, [link]);
-
-  /**
-   * Effect responsible for fetching the alternative text of the event icon.
-   * Runs whenever `link` changes.
-   *
-   * Sends a POST request to `/get_icon`.
-   *
-   * @async
-   * @effect
-   * @returns {Promise<void>}
-   */
-
-  useEffect(() => {
-    if (link) {
-      const fetchIcon = async () => {
+      const fetchMetadata = async () => {
         try {
-          const response = await fetch("http://127.0.0.1:5000/get_icon", {
+          const response = await fetch("http://127.0.0.1:5000/get_metadata", {
             method: "POST",
             headers: {
               "Content-Type": "application/json",
@@ -214,56 +170,22 @@ function EventPage() {
           }
 
           const data = await response.json();
+          setImageUrl(data.image_url);
           setIconAlt(data.icon_alt);
-        } catch (error) {
-          console.error("Erro ao buscar icone:", error);
-        }
-      };
-      fetchIcon();
-    }
-  }, [link]);
-
-  /**
-   * Effect responsible for fetching the image credits.
-   * Runs whenever `link` changes.
-   *
-   * Sends a POST request to `/get_credits`.
-   *
-   * @async
-   * @effect
-   * @returns {Promise<void>}
-   */
-
-  useEffect(() => {
-    if (link) {
-      setLoadingCredit(true);
-      setErrorCredit(null);
-      const fetchCredit = async () => {
-        try {
-          const response = await fetch("http://127.0.0.1:5000/get_credits", {
-            method: "POST",
-            headers: {
-              "Content-Type": "application/json",
-            },
-            body: JSON.stringify({ link: link }),
-          });
-
-          if (!response.ok) {
-            throw new Error(`Erro na API: ${response.status}`);
-          }
-
-          const data = await response.json();
           setCredit(data.credit_text);
         } catch (error) {
-          console.error("Erro ao buscar credito:", error);
+          console.error("Erro ao buscar metadados:", error);
+          setErrorImage(error.message);
           setErrorCredit(error.message);
         } finally {
+          setLoadingImage(false);
           setLoadingCredit(false);
         }
       };
 
-      fetchCredit();
+      fetchMetadata();
     } else {
+      setLoadingImage(false);
       setLoadingCredit(false);
     }
   }, [link]);
@@ -15,6 +15,7 @@
 * 1. /get_first_image  : Returns the full URL of the first image found on the given page.
 * 2. /get_icon         : Returns the 'alt' attribute of the second image on the page.
 * 3. /get_credits      : Returns the associated image credit text.
+* 4. /get_metadata     : Returns all three of the above in a single response.
 *
 * All endpoints expect to receive a JSON containing the key "link" with the site URL.
 * They return JSON with the requested data or appropriate error messages (400, 404, or 500).
@@ -42,18 +43,66 @@
 *
 * Notes:
 * - Enables CORS to allow requests from any origin.
-* - Run the server in debug mode for development.
+* - Runs threaded with debug off; use gunicorn for production deploys.
 * ***************************************************************************
 """
 
+import time
+from urllib.parse import urljoin
+
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml's C tokenizer when installed, stdlib pure-Python parser otherwise
+try:
+    import lxml  # noqa: F401
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+# The endpoints only ever look at images, credit headings and their
+# paragraphs, so the parser can skip building the rest of the tree
+_RELEVANT_TAGS = SoupStrainer(["img", "h2", "p"])
 
 app = Flask(__name__)
 CORS(app, resources={r"/*": {"origins": "*"}})
 
+# One shared Session for every endpoint: HTTP keep-alive reuses the TCP/TLS
+# connection to the scraped host instead of renegotiating it per request
+SESSION = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=64)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# Parsed-page cache: the front-end asks for image, icon and credits of the
+# same link in quick succession, so one fetch + parse serves all three
+CACHE_TTL = 300  # seconds
+CACHE_MAX_ENTRIES = 256  # each entry holds a parsed soup, so bound them
+_page_cache = {}
+
+
+def fetch_soup(link_site):
+    """Fetched and parsed page for a URL, cached for CACHE_TTL seconds."""
+    cached = _page_cache.get(link_site)
+    if cached:
+        if time.monotonic() - cached[0] < CACHE_TTL:
+            return cached[1]
+        # Expired: drop the stale soup instead of keeping it around
+        _page_cache.pop(link_site, None)
+
+    res = SESSION.get(link_site, timeout=(3, 10))
+    res.raise_for_status()
+    soup = BeautifulSoup(res.text, PARSER, parse_only=_RELEVANT_TAGS)
+
+    # Distinct URLs that are never requested again would otherwise pile
+    # up; evict the oldest insertion once the cap is reached
+    if len(_page_cache) >= CACHE_MAX_ENTRIES:
+        _page_cache.pop(next(iter(_page_cache)))
+    _page_cache[link_site] = (time.monotonic(), soup)
+    return soup
+
 
 @app.route('/get_first_image', methods=['POST'])
 def get_first_image():
@@ -65,9 +114,7 @@ def get_first_image():
         return jsonify({'error': 'Link do site não fornecido.'}), 400
 
     try:
-        res = requests.get(link_site)
-        res.raise_for_status() 
-        dados = BeautifulSoup(res.text, "html.parser")
+        dados = fetch_soup(link_site)
         primeira_imagem = dados.find('img')
       
         if primeira_imagem:
@@ -90,11 +137,8 @@ def get_icon():
         return jsonify({'error': 'Link do site não fornecido.'}), 400
 
     try:
-        res = requests.get(link_site)
-        res.raise_for_status() 
-        
-        dados = BeautifulSoup(res.text, "html.parser")
-        imagens = dados.find_all('img') 
+        dados = fetch_soup(link_site)
+        imagens = dados.find_all('img')
 
         if len(imagens) > 1:
             segundo_icon = imagens[1]  
@@ -115,11 +159,8 @@ def get_credits():
         return jsonify({'error': 'Link do site não fornecido.'}), 400
 
     try:
-        res = requests.get(link_site)
-        res.raise_for_status() 
-        
-        dados = BeautifulSoup(res.text, "html.parser")
-        texto = dados.find('h2', string='Image credit')  
+        dados = fetch_soup(link_site)
+        texto = dados.find('h2', string='Image credit')
 
         if texto: 
             credit = texto.find_next_sibling('p').text
@@ -130,5 +171,38 @@ def get_credits():
     except requests.exceptions.RequestException as e:
         return jsonify({'error': f'Erro ao acessar o site: {e}'}), 500
 
+@app.route('/get_metadata', methods=['POST'])
+def get_metadata():
+    # Fused version of the three endpoints above: one fetch + one parse
+    # returns image, icon text and credits together, so the front-end
+    # needs a single round-trip per event page
+    data = request.get_json()
+    link_site = data.get('link')
+
+    if not link_site:
+        return jsonify({'error': 'Link do site não fornecido.'}), 400
+
+    try:
+        dados = fetch_soup(link_site)
+
+        imagens = dados.find_all('img')
+        image_url = urljoin(link_site, imagens[0].get('src')) if imagens else None
+        icon_alt = imagens[1].get('alt', '') if len(imagens) > 1 else None
+
+        texto = dados.find('h2', string='Image credit')
+        credit = texto.find_next_sibling('p').text if texto else None
+
+        return jsonify({
+            'image_url': image_url,
+            'icon_alt': icon_alt,
+            'credit_text': credit,
+        })
+
+    except requests.exceptions.RequestException as e:
+        return jsonify({'error': f'Erro ao acessar o site: {e}'}), 500
+
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    # Threaded so slow upstream sites don't serialize other requests; in
+    # production run under gunicorn instead (already in requirements.txt):
+    #   gunicorn -w 2 -k gthread --threads 16 -b 0.0.0.0:5000 scraping:app
+    app.run(debug=False, threaded=True)
\ No newline at end of file
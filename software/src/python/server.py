@@ -1,7 +1,7 @@
-""" 
+"""
 * **************************************************************************
 * File name: server.py
-* Description: Prediction script using an XGBoost model.
+* Description: Prediction service using an XGBoost model.
 *
 * Author: Rafaela Fernandes Savaris
 * Creation date: 10/29/2025
@@ -9,32 +9,42 @@
 * Contact: savarisf.rafaela@gmail.com
 * **************************************************************************
 * Description:
-* This script reads JSON data from standard input (`stdin`), loads a trained
-* model (`modelo_xgb.json`), and returns the prediction probability in JSON format.
+* This script runs a small Flask service that loads the trained model
+* (`modelo_xgb.json`) once at startup and answers prediction requests over
+* HTTP. Keeping the process alive amortizes the interpreter start, the
+* xgboost import and the model load across every prediction, instead of
+* paying all three on each request as the old one-shot stdin script did.
 *
 * Flow:
-* 1. Reads and validates the input data.
-* 2. Loads the XGBoost model from the specified path.
+* 1. Loads the XGBoost model once, when the process starts.
+* 2. Receives JSON on POST /predict with the key "features".
 * 3. Executes the prediction and returns the probability.
-* 
+*
+* POST /predict_batch accepts a list of feature rows under the same key
+* and scores them in a single model call, for offline/bulk scoring.
+*
 * Inputs:
-*    - JSON via stdin, with the key "features" containing the list of attributes.
+*    - JSON via POST /predict, with the key "features" containing the list
+*      of attributes (or a list of such lists on /predict_batch).
 *
 * Outputs:
 *    - JSON with the key "prediction", containing the probabilities.
 *    - In case of error, JSON with the key "error" and the error description.
 *
 * Error handling:
-*    - Invalid input reading: prints {"error": "..."} and exits with code 1.
-*    - Failure to load model: prints {"error": "..."} and exits with code 1.
-*    - Prediction failure: prints {"error": "..."} and exits with code 1.
-* 
+*    - Invalid request body: returns {"error": "..."} with status 400.
+*    - Prediction failure: returns {"error": "..."} with status 500.
+*    - Failure to load model: the service logs the error and exits with
+*      code 1 at startup (nothing can be served without the model).
+*
 * Requirements:
 *   - Python 3.13.1
 *   - Libraries:
 *       - json: works with JSON data;
 *       - os: interacts with the operating system;
 *       - sys: handles the execution environment and input/output;
+*       - flask: serves the prediction endpoint;
+*       - numpy: builds the float32 feature row;
 *       - xgboost: implements the XGBoost algorithm.
 * **************************************************************************
 """
@@ -42,32 +52,70 @@
 import json
 import os
 import sys
+
+import numpy as np
 import xgboost as xgb
+from flask import Flask, jsonify, request
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 MODEL_PATH = os.path.join(BASE_DIR, "modelo_xgb.json")
+PORT = 5001
 
-# Reads input data and extracts features
+# Loads the booster once at startup; every request reuses it. The bare
+# Booster skips the sklearn wrapper, whose predict_proba rebuilds a
+# DMatrix from the Python list on every call
 try:
-    input_str = sys.stdin.read()
-    data = json.loads(input_str)
-    features = data["features"]
-except Exception as e:
-    print(json.dumps({"error": f"Erro ao ler entrada: {e}"}))
-    sys.exit(1)
-
-# Loads the XGBoost model saved at the specified location
-try:
-    model = xgb.XGBClassifier()
-    model.load_model(MODEL_PATH)
+    booster = xgb.Booster()
+    booster.load_model(MODEL_PATH)
+    # A one-row prediction traverses a few thousand tree nodes; waking
+    # the OpenMP thread pool costs more than the traversal itself, so
+    # serve on a single thread
+    booster.set_param({"nthread": 1})
 except Exception as e:
     print(json.dumps({"error": f"Erro ao carregar modelo: {e}"}))
     sys.exit(1)
 
-# Performs prediction and returns the result in JSON format
-try:
-    pred_prob = model.predict_proba([features])
-    print(json.dumps({"prediction": pred_prob.tolist()}))
-except Exception as e:
-    print(json.dumps({"error": f"Erro ao predizer: {e}"}))
-    sys.exit(1)
\ No newline at end of file
+app = Flask(__name__)
+
+
+@app.route("/predict", methods=["POST"])
+def predict():
+    # Reads input data and extracts features
+    try:
+        data = request.get_json()
+        features = data["features"]
+    except Exception as e:
+        return jsonify({"error": f"Erro ao ler entrada: {e}"}), 400
+
+    # Performs prediction and returns the result in JSON format.
+    # inplace_predict reads the float32 row buffer directly, with no
+    # per-request DMatrix construction
+    try:
+        x = np.asarray(features, dtype=np.float32).reshape(1, -1)
+        prob = float(booster.inplace_predict(x)[0])
+        return jsonify({"prediction": [[1.0 - prob, prob]]})
+    except Exception as e:
+        return jsonify({"error": f"Erro ao predizer: {e}"}), 500
+
+
+@app.route("/predict_batch", methods=["POST"])
+def predict_batch():
+    # Reads input data: a list of feature rows
+    try:
+        data = request.get_json()
+        rows = data["features"]
+    except Exception as e:
+        return jsonify({"error": f"Erro ao ler entrada: {e}"}), 400
+
+    # One inplace_predict over the stacked matrix amortizes the fixed
+    # per-call overhead across the whole batch
+    try:
+        x = np.asarray(rows, dtype=np.float32).reshape(len(rows), -1)
+        probs = booster.inplace_predict(x)
+        return jsonify({"prediction": [[1.0 - float(p), float(p)] for p in probs]})
+    except Exception as e:
+        return jsonify({"error": f"Erro ao predizer: {e}"}), 500
+
+
+if __name__ == "__main__":
+    app.run(host="127.0.0.1", port=PORT, debug=False)